@@ -4,17 +4,25 @@ Reads config.yaml, substitutes environment variables, resolves paths,
 validates constraints, and caches the result as a singleton.
 """
 
+import functools
 import os
 import re
+from collections.abc import Mapping
 from pathlib import Path
 
-import yaml
-from dotenv import load_dotenv
 from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
 
 _ENV_VAR_PATTERN = re.compile(r"\$\{([^}]+)\}")
 
 
+@functools.lru_cache(maxsize=4)
+def _join_url(base_url: str, endpoint: str) -> str:
+    """Join a base URL and an endpoint path with exactly one slash."""
+    if not endpoint.startswith("/"):
+        endpoint = "/" + endpoint
+    return base_url.rstrip("/") + endpoint
+
+
 class DirectoriesConfig(BaseModel):
     model_config = ConfigDict(frozen=True)
 
@@ -41,6 +49,11 @@ class DeepfellowConfig(BaseModel):
             raise ValueError(msg)
         return v
 
+    @property
+    def ocr_url(self) -> str:
+        """Full OCR URL built from the current base_url and ocr_endpoint."""
+        return _join_url(self.base_url, self.ocr_endpoint)
+
 
 class Recipient(BaseModel):
     model_config = ConfigDict(frozen=True)
@@ -69,38 +82,62 @@ class Config(BaseModel):
 _config: Config | None = None
 
 
-def _substitute_env_vars(value: str) -> str:
-    """Replace ${VAR} patterns with environment variable values."""
+def _env_replacer(env: Mapping[str, str], match: re.Match[str]) -> str:
+    """Return the environment value for a single ${VAR} match."""
+    var_name = match.group(1)
+    try:
+        return env[var_name]
+    except KeyError:
+        msg = f"Environment variable '{var_name}' is not set"
+        raise ValueError(msg) from None
+
+
+# Bound once; the os.environ default is by far the common case.
+_ENVIRON_REPLACER = functools.partial(_env_replacer, os.environ)
 
-    def replacer(match: re.Match[str]) -> str:
-        var_name = match.group(1)
-        try:
-            return os.environ[var_name]
-        except KeyError:
-            msg = f"Environment variable '{var_name}' is not set"
-            raise ValueError(msg) from None
 
+def _substitute_env_vars(value: str, env: Mapping[str, str] | None = None) -> str:
+    """Replace ${VAR} patterns with values from env (os.environ by default)."""
+    if "${" not in value:
+        return value
+    if env is None:
+        env = os.environ
+    # Compare against the bound mapping, not os.environ, in case it was replaced.
+    if env is _ENVIRON_REPLACER.args[0]:
+        replacer = _ENVIRON_REPLACER
+    else:
+        replacer = functools.partial(_env_replacer, env)
     return _ENV_VAR_PATTERN.sub(replacer, value)
 
 
-def _process_env_vars(data: object) -> object:
-    """Recursively walk parsed YAML and substitute env vars in strings."""
-    if isinstance(data, str):
-        return _substitute_env_vars(data)
+def _process_env_vars(data: object, env: Mapping[str, str] | None = None) -> object:
+    """Substitute env vars in strings of parsed YAML, mutating containers in place."""
+    if env is None:
+        env = os.environ
+    # Strings are the most common node; the safe loader never yields str
+    # subclasses, so an exact type check is enough.
+    if type(data) is str:
+        return _substitute_env_vars(data, env)
     if isinstance(data, dict):
-        return {k: _process_env_vars(v) for k, v in data.items()}
-    if isinstance(data, list):
-        return [_process_env_vars(item) for item in data]
+        for key, value in data.items():
+            data[key] = _process_env_vars(value, env)
+    elif isinstance(data, list):
+        for i, item in enumerate(data):
+            data[i] = _process_env_vars(item, env)
     return data
 
 
+@functools.cache
 def _find_project_root() -> Path:
     """Walk up from this file's directory looking for config.yaml."""
-    current = Path(__file__).resolve().parent
-    while current != current.parent:
-        if (current / "config.yaml").exists():
-            return current
-        current = current.parent
+    current = os.path.dirname(os.path.realpath(__file__))
+    while True:
+        parent = os.path.dirname(current)
+        if parent == current:
+            break
+        if os.path.isfile(os.path.join(current, "config.yaml")):
+            return Path(current)
+        current = parent
     msg = "Could not find config.yaml in any parent directory"
     raise FileNotFoundError(msg)
 
@@ -124,42 +161,36 @@ def _resolve_paths(config: Config, root: Path) -> Config:
 
 def _validate_config(config: Config) -> None:
     """Validate runtime constraints that depend on the environment."""
-    if not config.directories.watch.exists():
+    try:
+        os.stat(config.directories.watch)
+    except OSError:
         msg = f"Watch directory does not exist: {config.directories.watch}"
-        raise FileNotFoundError(msg)
+        raise FileNotFoundError(msg) from None
 
 
-def load_config(config_path: Path | None = None) -> Config:
-    """Load, parse, validate, and cache the configuration."""
-    global _config
-    if _config is not None:
-        if config_path is None:
-            return _config
-        msg = "Configuration is already loaded. Call _reset_config() first to reload."
-        raise RuntimeError(msg)
+def load_dotenv() -> bool:
+    """Load .env into os.environ, importing python-dotenv on first use."""
+    from dotenv import load_dotenv as _load_dotenv
 
-    load_dotenv()
+    return _load_dotenv()
 
-    if config_path is None:
-        root = _find_project_root()
-        config_path = root / "config.yaml"
-    else:
-        config_path = config_path.resolve()
 
-    root = config_path.parent
+def _load_config_file(config_path: Path) -> Config:
+    """Read, parse, and validate a config file, resolving paths against its dir."""
+    import yaml
 
     if not config_path.is_file():
         msg = f"Configuration file not found: {config_path}"
         raise FileNotFoundError(msg)
 
     try:
-        text = config_path.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError) as e:
+        # Prefer the libyaml-backed loader; PyYAML may be built without it.
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        with config_path.open("rb") as stream:
+            raw = yaml.load(stream, Loader=loader)
+    except OSError as e:
         msg = f"Failed to read configuration file {config_path}: {e}"
         raise ValueError(msg) from e
-
-    try:
-        raw = yaml.safe_load(text)
     except yaml.YAMLError as e:
         msg = f"Failed to parse configuration file {config_path}: {e}"
         raise ValueError(msg) from e
@@ -180,10 +211,28 @@ def load_config(config_path: Path | None = None) -> Config:
         msg = f"Invalid configuration in {config_path}: {e}"
         raise ValueError(msg) from e
 
-    config = _resolve_paths(config, root)
+    config = _resolve_paths(config, config_path.parent)
     _validate_config(config)
+    return config
+
+
+def load_config(config_path: Path | None = None) -> Config:
+    """Load, parse, validate, and cache the configuration."""
+    global _config
+    if _config is not None:
+        if config_path is None:
+            return _config
+        msg = "Configuration is already loaded. Call _reset_config() first to reload."
+        raise RuntimeError(msg)
+
+    load_dotenv()
+
+    if config_path is None:
+        config_path = _find_project_root() / "config.yaml"
+    else:
+        config_path = config_path.resolve()
 
-    _config = config
+    _config = _load_config_file(config_path)
     return _config
 
 
@@ -198,3 +247,4 @@ def _reset_config() -> None:
     """Clear the singleton cache (for tests)."""
     global _config
     _config = None
+    _find_project_root.cache_clear()
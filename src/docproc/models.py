@@ -5,18 +5,30 @@ ProcessingJob → OCRResult + VisionResult → ReconciledDocument
 → Classification → ProcessedDocument
 """
 
+import re
 from datetime import UTC, date, datetime
 from pathlib import Path
 from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    StringConstraints,
+    field_validator,
+)
 
 # Slash-separated dates are interpreted as European (dd/mm/YYYY).
 # US month-first format is excluded to avoid silent misinterpretation
-# of ambiguous dates like "03/04/2024".
-_DATE_FORMATS = ("%d/%m/%Y", "%d.%m.%Y")
+# of ambiguous dates like "03/04/2024". Accepts dd/mm/YYYY and dd.mm.YYYY
+# with a consistent separator.
+_EURO_DATE_RE = re.compile(r"([0-9]{1,2})([./])([0-9]{1,2})\2([0-9]{4})")
 
 Confidence = Annotated[float, Field(ge=0.0, le=1.0)]
+NonBlankStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+FileType = Annotated[
+    str, StringConstraints(strip_whitespace=True, to_lower=True, min_length=1)
+]
 
 
 def _parse_date(value: object) -> date | None:
@@ -30,23 +42,26 @@ def _parse_date(value: object) -> date | None:
     if not isinstance(value, str):
         msg = f"Cannot parse date from {type(value).__name__}"
         raise ValueError(msg)
-    value = value.strip()
-    if not value:
-        msg = "Cannot parse date from empty string"
-        raise ValueError(msg)
+    # Well-formed ISO dates are the common case and need no stripping.
     try:
         return date.fromisoformat(value)
     except ValueError:
         pass
+    value = value.strip()
+    if not value:
+        msg = "Cannot parse date from empty string"
+        raise ValueError(msg)
     try:
         return datetime.fromisoformat(value).date()
     except ValueError:
         pass
-    for fmt in _DATE_FORMATS:
+    match = _EURO_DATE_RE.fullmatch(value)
+    if match:
+        day, _, month, year = match.groups()
         try:
-            return datetime.strptime(value, fmt).date()
+            return date(int(year), int(month), int(day))
         except ValueError:
-            continue
+            pass
     msg = f"Cannot parse date: {value!r}"
     raise ValueError(msg)
 
@@ -55,33 +70,29 @@ class ProcessingJob(BaseModel):
     model_config = ConfigDict(validate_assignment=True)
 
     file_path: Path
-    file_type: str = Field(min_length=1)
-
-    @field_validator("file_type")
-    @classmethod
-    def file_type_must_not_be_blank(cls, v: str) -> str:
-        stripped = v.strip().lower()
-        if not stripped:
-            msg = "file_type must not be blank"
-            raise ValueError(msg)
-        return stripped
-
+    file_type: FileType
     created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
     status: Literal["pending", "processing", "done", "failed"] = "pending"
 
 
 class PageText(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     page_number: int = Field(ge=1)
     text: str
 
 
 class OCRResult(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     text: str
     pages: list[PageText]
     confidence: Confidence | None = None
 
 
 class VisionResult(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     content: str
     tables: list[str] | None = None
     structural_notes: str | None = None
@@ -104,21 +115,12 @@ class ReconciledDocument(BaseModel):
 class Classification(BaseModel):
     model_config = ConfigDict(validate_assignment=True)
 
-    recipient: str = Field(min_length=1)
-    category: str = Field(min_length=1)
-    subject: str = Field(min_length=1)
+    recipient: NonBlankStr
+    category: NonBlankStr
+    subject: NonBlankStr
     confidence: Confidence | None = None
     reasoning: str | None = None
 
-    @field_validator("recipient", "category", "subject")
-    @classmethod
-    def must_not_be_blank(cls, v: str) -> str:
-        stripped = v.strip()
-        if not stripped:
-            msg = "Field must not be blank"
-            raise ValueError(msg)
-        return stripped
-
 
 class ProcessedDocument(BaseModel):
     model_config = ConfigDict(validate_assignment=True)
@@ -7,23 +7,43 @@ execution with Vision extraction.
 
 import asyncio
 import logging
+import os
+import stat
 from pathlib import Path
 from typing import Any
 
 import httpx
+import orjson
 from pydantic import ValidationError
 
 from docproc.config import Config
-from docproc.models import OCRResult, PageText
+from docproc.models import OCRResult
 
 logger = logging.getLogger(__name__)
 
-SUPPORTED_EXTENSIONS = frozenset({".pdf", ".png", ".jpg", ".jpeg", ".tiff", ".tif"})
+_MIME_TYPES = {
+    ".pdf": "application/pdf",
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".tiff": "image/tiff",
+    ".tif": "image/tiff",
+}
+
+SUPPORTED_EXTENSIONS = frozenset(_MIME_TYPES)
 
 _MAX_RETRIES = 3
 _INITIAL_DELAY = 1.0
 _BACKOFF_FACTOR = 2.0
 _TIMEOUT_SECONDS = 120.0
+_RETRY_DELAYS = tuple(
+    _INITIAL_DELAY * _BACKOFF_FACTOR**i for i in range(_MAX_RETRIES - 1)
+)
+_MAX_KEEPALIVE_CONNECTIONS = 16
+_MAX_CONNECTIONS = 32
+
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
 
 
 class OCRError(Exception):
@@ -31,23 +51,59 @@ class OCRError(Exception):
 
 
 def _validate_file(file_path: Path) -> None:
-    """Check that the file exists, is a regular file, and has a supported extension."""
-    if not file_path.is_file():
-        msg = f"File not found or not a regular file: {file_path}"
-        raise OCRError(msg)
-    ext = file_path.suffix.lower()
+    """Check that the file has a supported extension and is a regular file.
+
+    The extension is checked first so unsupported files are rejected
+    without a filesystem call.
+    """
+    path_str = os.fspath(file_path)
+    ext = os.path.splitext(path_str)[1].lower()
     if ext not in SUPPORTED_EXTENSIONS:
         msg = f"Unsupported file type: {ext}"
         raise OCRError(msg)
+    try:
+        is_regular = stat.S_ISREG(os.stat(path_str).st_mode)
+    except OSError:
+        is_regular = False
+    if not is_regular:
+        msg = f"File not found or not a regular file: {file_path}"
+        raise OCRError(msg)
 
 
 def _build_url(config: Config) -> str:
-    """Join base_url and ocr_endpoint into a full URL."""
-    base = config.deepfellow.base_url.rstrip("/")
-    endpoint = config.deepfellow.ocr_endpoint
-    if not endpoint.startswith("/"):
-        endpoint = "/" + endpoint
-    return base + endpoint
+    """Return the full OCR URL derived from the config."""
+    return config.deepfellow.ocr_url
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use.
+
+    Pooled connections belong to the event loop that opened them, so a
+    new client is built whenever the running loop changes (e.g. one
+    asyncio.run() per processed file). The old client is dropped without
+    closing it, since its loop may already be closed.
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client_loop = loop
+        _client = httpx.AsyncClient(
+            timeout=_TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_keepalive_connections=_MAX_KEEPALIVE_CONNECTIONS,
+                max_connections=_MAX_CONNECTIONS,
+            ),
+        )
+    return _client
+
+
+async def aclose_client() -> None:
+    """Close the shared HTTP client. Call once on application shutdown."""
+    global _client, _client_loop
+    if _client is not None and _client_loop is asyncio.get_running_loop():
+        await _client.aclose()
+    _client = None
+    _client_loop = None
 
 
 def _parse_response(data: dict[str, Any]) -> OCRResult:
@@ -57,75 +113,83 @@ def _parse_response(data: dict[str, Any]) -> OCRResult:
         msg = f"Malformed OCR response: missing 'pages' key. Response keys: {keys}"
         raise OCRError(msg)
     try:
-        pages = [
-            PageText(page_number=p["page_number"], text=p["text"])
-            for p in data["pages"]
-        ]
-        full_text = "\n\n".join(p.text for p in pages)
-        confidence = data.get("confidence")
-        return OCRResult(text=full_text, pages=pages, confidence=confidence)
+        page_dicts = data["pages"]
+        full_text = "\n\n".join([p["text"] for p in page_dicts])
+        # A single nested validation keeps every page checked while crossing
+        # into pydantic-core once instead of once per PageText.
+        return OCRResult.model_validate(
+            {
+                "text": full_text,
+                "pages": page_dicts,
+                "confidence": data.get("confidence"),
+            }
+        )
     except (KeyError, TypeError, ValidationError) as exc:
         msg = f"Malformed OCR response: {exc}"
         raise OCRError(msg) from exc
 
 
+async def _backoff(attempt: int) -> None:
+    """Sleep before the next retry; no-op after the final attempt."""
+    if attempt < _MAX_RETRIES:
+        await asyncio.sleep(_RETRY_DELAYS[attempt - 1])
+
+
 async def _send_with_retry(
     client: httpx.AsyncClient,
     url: str,
     file_path: Path,
     api_key: str,
 ) -> dict[str, Any]:
-    """POST the file with exponential backoff retry on 5xx/timeouts."""
-    try:
-        file_bytes = file_path.read_bytes()
-    except OSError as exc:
-        msg = f"Failed to read file {file_path}: {exc}"
-        raise OCRError(msg) from exc
+    """POST the file with exponential backoff retry on 5xx/timeouts.
 
-    delay = _INITIAL_DELAY
+    The file is streamed into the multipart body and reopened on every
+    attempt, so large scans are never held in memory as a whole.
+    """
     last_error: Exception | None = None
+    headers = {"Authorization": f"Bearer {api_key}"}
+    mime_type = _MIME_TYPES[os.path.splitext(file_path.name)[1].lower()]
 
     for attempt in range(1, _MAX_RETRIES + 1):
         try:
-            files = {"file": (file_path.name, file_bytes)}
-            headers = {"Authorization": f"Bearer {api_key}"}
-            response = await client.post(
-                url,
-                files=files,
-                headers=headers,
-                timeout=_TIMEOUT_SECONDS,
-            )
-
-            if response.status_code >= 500:
-                last_error = OCRError(
-                    f"Server error {response.status_code}: {response.text}"
-                )
-                logger.warning(
-                    "OCR attempt %d/%d for '%s' failed (HTTP %d): %s",
-                    attempt,
-                    _MAX_RETRIES,
-                    file_path.name,
-                    response.status_code,
-                    response.text[:200],
+            with file_path.open("rb") as stream:
+                files = {"file": (file_path.name, stream, mime_type)}
+                response = await client.post(
+                    url,
+                    files=files,
+                    headers=headers,
+                    timeout=_TIMEOUT_SECONDS,
                 )
-                if attempt < _MAX_RETRIES:
-                    await asyncio.sleep(delay)
-                    delay *= _BACKOFF_FACTOR
-                continue
 
-            if response.status_code >= 400:
-                msg = f"Client error {response.status_code}: {response.text}"
+            status = response.status_code
+            if status < 400:
+                try:
+                    return orjson.loads(response.content)
+                except orjson.JSONDecodeError as exc:
+                    msg = (
+                        f"OCR API returned non-JSON response "
+                        f"(status {status}): {response.text[:200]}"
+                    )
+                    raise OCRError(msg) from exc
+
+            if status < 500:
+                msg = f"Client error {status}: {response.text}"
                 raise OCRError(msg)
 
-            try:
-                return response.json()
-            except ValueError as exc:
-                msg = (
-                    f"OCR API returned non-JSON response "
-                    f"(status {response.status_code}): {response.text[:200]}"
-                )
-                raise OCRError(msg) from exc
+            last_error = OCRError(f"Server error {status}: {response.text}")
+            logger.warning(
+                "OCR attempt %d/%d for '%s' failed (HTTP %d): %s",
+                attempt,
+                _MAX_RETRIES,
+                file_path.name,
+                status,
+                response.text[:200],
+            )
+            await _backoff(attempt)
 
+        except OSError as exc:
+            msg = f"Failed to read file {file_path}: {exc}"
+            raise OCRError(msg) from exc
         except httpx.TransportError as exc:
             last_error = OCRError(f"Transport error: {exc}")
             logger.warning(
@@ -135,9 +199,7 @@ async def _send_with_retry(
                 file_path.name,
                 exc,
             )
-            if attempt < _MAX_RETRIES:
-                await asyncio.sleep(delay)
-                delay *= _BACKOFF_FACTOR
+            await _backoff(attempt)
 
     msg = f"OCR failed after {_MAX_RETRIES} attempts"
     logger.error(
@@ -167,8 +229,9 @@ async def extract_text(file_path: Path, config: Config) -> OCRResult:
 
     logger.info("Starting OCR extraction: %s", file_path.name)
 
-    async with httpx.AsyncClient() as client:
-        data = await _send_with_retry(client, url, file_path, config.deepfellow.api_key)
+    data = await _send_with_retry(
+        _get_client(), url, file_path, config.deepfellow.api_key
+    )
 
     result = _parse_response(data)
     logger.info("OCR complete: %s (%d pages)", file_path.name, len(result.pages))
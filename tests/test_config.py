@@ -8,14 +8,21 @@ import yaml
 
 from docproc.config import (
     Config,
+    DeepfellowConfig,
     _find_project_root,
     _process_env_vars,
     _reset_config,
     _substitute_env_vars,
     get_config,
     load_config,
+    load_dotenv,
 )
 
+try:
+    from yaml import CSafeDumper as _SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper
+
 MINIMAL_CONFIG = {
     "directories": {"watch": "./inbox", "output": "./output"},
     "deepfellow": {
@@ -30,6 +37,9 @@ MINIMAL_CONFIG = {
     "recipients": [{"name": "Test User", "tags": ["tag1", "tag2"]}],
 }
 
+# Rendered once; most tests only need the unmodified config on disk.
+MINIMAL_CONFIG_YAML = yaml.dump(MINIMAL_CONFIG, Dumper=_SafeDumper)
+
 
 @pytest.fixture(autouse=True)
 def reset_config():
@@ -44,7 +54,7 @@ def config_dir(tmp_path: Path) -> Path:
     (tmp_path / "inbox").mkdir()
     (tmp_path / "output").mkdir()
     config_path = tmp_path / "config.yaml"
-    config_path.write_text(yaml.dump(MINIMAL_CONFIG))
+    config_path.write_text(MINIMAL_CONFIG_YAML)
     return tmp_path
 
 
@@ -58,19 +68,34 @@ def config_dir(tmp_path: Path) -> Path:
         ("prefix-${MY_VAR}-suffix", {"MY_VAR": "mid"}, "prefix-mid-suffix"),
         ("no vars here", {}, "no vars here"),
         ("${A}and${B}", {"A": "1", "B": "2"}, "1and2"),
+        ("pa$$word-$HOME-$", {"HOME": "/root"}, "pa$$word-$HOME-$"),
     ],
 )
 def test_substitute_env_vars_replaces_patterns(template, env, expected):
-    with mock.patch.dict("os.environ", env, clear=True):
-        assert _substitute_env_vars(template) == expected
+    assert _substitute_env_vars(template, env) == expected
 
 
 def test_substitute_env_vars_raises_on_missing_var():
-    with (
-        mock.patch.dict("os.environ", {}, clear=True),
-        pytest.raises(ValueError, match="MISSING_VAR"),
-    ):
-        _substitute_env_vars("${MISSING_VAR}")
+    with pytest.raises(ValueError, match="MISSING_VAR"):
+        _substitute_env_vars("${MISSING_VAR}", {})
+
+
+def test_substitute_env_vars_defaults_to_os_environ():
+    with mock.patch.dict("os.environ", {"MY_VAR": "from-env"}):
+        assert _substitute_env_vars("${MY_VAR}") == "from-env"
+
+
+def test_substitute_env_vars_sees_os_environ_changes():
+    with mock.patch.dict("os.environ", {"MY_VAR": "first"}):
+        assert _substitute_env_vars("${MY_VAR}") == "first"
+    with mock.patch.dict("os.environ", {"MY_VAR": "second"}):
+        assert _substitute_env_vars("${MY_VAR}") == "second"
+
+
+def test_substitute_env_vars_sees_replaced_os_environ():
+    with mock.patch("os.environ", {"MY_VAR": "replaced"}):
+        assert _substitute_env_vars("${MY_VAR}") == "replaced"
+        assert _process_env_vars({"key": "${MY_VAR}"}) == {"key": "replaced"}
 
 
 # --- _process_env_vars ---
@@ -78,18 +103,26 @@ def test_substitute_env_vars_raises_on_missing_var():
 
 def test_process_env_vars_handles_nested_dict():
     data = {"outer": {"inner": "${VAR}"}}
-    with mock.patch.dict("os.environ", {"VAR": "value"}):
-        result = _process_env_vars(data)
+    result = _process_env_vars(data, {"VAR": "value"})
     assert result == {"outer": {"inner": "value"}}
 
 
 def test_process_env_vars_handles_list():
     data = ["${VAR}", "plain"]
-    with mock.patch.dict("os.environ", {"VAR": "value"}):
-        result = _process_env_vars(data)
+    result = _process_env_vars(data, {"VAR": "value"})
     assert result == ["value", "plain"]
 
 
+def test_process_env_vars_mutates_containers_in_place():
+    inner = {"key": "${VAR}"}
+    data = {"outer": inner, "items": ["${VAR}"]}
+    result = _process_env_vars(data, {"VAR": "value"})
+    assert result is data
+    assert result["outer"] is inner
+    assert inner == {"key": "value"}
+    assert data["items"] == ["value"]
+
+
 def test_process_env_vars_passes_non_strings_through():
     assert _process_env_vars(42) == 42
     assert _process_env_vars(3.14) == 3.14
@@ -97,6 +130,26 @@ def test_process_env_vars_passes_non_strings_through():
     assert _process_env_vars(None) is None
 
 
+# --- DeepfellowConfig.ocr_url ---
+
+
+def test_deepfellow_config_ocr_url_follows_model_copy():
+    deepfellow = DeepfellowConfig.model_validate(MINIMAL_CONFIG["deepfellow"])
+    assert deepfellow.ocr_url == "http://localhost:8000/v1/ocr"
+    moved = deepfellow.model_copy(update={"base_url": "http://ocr.example/"})
+    assert moved.ocr_url == "http://ocr.example/v1/ocr"
+    assert deepfellow.ocr_url == "http://localhost:8000/v1/ocr"
+
+
+# --- load_dotenv ---
+
+
+@mock.patch("dotenv.load_dotenv", return_value=True)
+def test_load_dotenv_delegates_to_python_dotenv(mock_dotenv_load_dotenv):
+    assert load_dotenv() is True
+    assert mock_dotenv_load_dotenv.call_count == 1
+
+
 # --- load_config ---
 
 
@@ -148,7 +201,7 @@ def test_reset_config_clears_cache(mock_load_dotenv, config_dir):
 def test_load_config_raises_on_missing_watch_dir(mock_load_dotenv, tmp_path):
     (tmp_path / "output").mkdir()
     config_path = tmp_path / "config.yaml"
-    config_path.write_text(yaml.dump(MINIMAL_CONFIG))
+    config_path.write_text(MINIMAL_CONFIG_YAML)
     with pytest.raises(FileNotFoundError, match="Watch directory"):
         load_config(config_path)
 
@@ -156,7 +209,7 @@ def test_load_config_raises_on_missing_watch_dir(mock_load_dotenv, tmp_path):
 @mock.patch("docproc.config.load_dotenv")
 def test_load_config_raises_on_empty_recipients(mock_load_dotenv, config_dir):
     config_data = {**MINIMAL_CONFIG, "recipients": []}
-    (config_dir / "config.yaml").write_text(yaml.dump(config_data))
+    (config_dir / "config.yaml").write_text(yaml.dump(config_data, Dumper=_SafeDumper))
     with pytest.raises(ValueError, match="Invalid configuration"):
         load_config(config_dir / "config.yaml")
 
@@ -167,7 +220,7 @@ def test_load_config_raises_on_missing_env_var(mock_load_dotenv, config_dir):
         **MINIMAL_CONFIG,
         "deepfellow": {**MINIMAL_CONFIG["deepfellow"], "api_key": "${NONEXISTENT}"},
     }
-    (config_dir / "config.yaml").write_text(yaml.dump(config_data))
+    (config_dir / "config.yaml").write_text(yaml.dump(config_data, Dumper=_SafeDumper))
     with (
         mock.patch.dict("os.environ", {}, clear=True),
         pytest.raises(ValueError, match="NONEXISTENT"),
@@ -181,7 +234,7 @@ def test_load_config_raises_on_blank_api_key(mock_load_dotenv, config_dir):
         **MINIMAL_CONFIG,
         "deepfellow": {**MINIMAL_CONFIG["deepfellow"], "api_key": "   "},
     }
-    (config_dir / "config.yaml").write_text(yaml.dump(config_data))
+    (config_dir / "config.yaml").write_text(yaml.dump(config_data, Dumper=_SafeDumper))
     with pytest.raises(ValueError, match="Invalid configuration"):
         load_config(config_dir / "config.yaml")
 
@@ -206,6 +259,13 @@ def test_load_config_raises_on_invalid_yaml(mock_load_dotenv, config_dir):
         load_config(config_dir / "config.yaml")
 
 
+@mock.patch("docproc.config.load_dotenv")
+def test_load_config_raises_on_invalid_utf8(mock_load_dotenv, config_dir):
+    (config_dir / "config.yaml").write_bytes(b"directories: \xff\xfe")
+    with pytest.raises(ValueError, match="Failed to parse"):
+        load_config(config_dir / "config.yaml")
+
+
 # --- get_config ---
 
 
@@ -253,3 +313,17 @@ def test_find_project_root_finds_config_in_parent(tmp_path):
     with mock.patch.object(config_module, "__file__", str(fake_file)):
         root = _find_project_root()
     assert root == tmp_path
+
+
+def test_find_project_root_caches_result(tmp_path):
+    (tmp_path / "config.yaml").touch()
+    fake_file = tmp_path / "src" / "pkg" / "module.py"
+    fake_file.parent.mkdir(parents=True)
+    fake_file.touch()
+    import docproc.config as config_module
+
+    with mock.patch.object(config_module, "__file__", str(fake_file)):
+        root1 = _find_project_root()
+        (tmp_path / "config.yaml").unlink()
+        root2 = _find_project_root()
+    assert root1 is root2
@@ -91,6 +91,12 @@ def test_page_text_rejects_page_number_less_than_one(page_number):
         PageText(page_number=page_number, text="Hello")
 
 
+def test_page_text_is_immutable():
+    page = PageText(page_number=1, text="Hello")
+    with pytest.raises(ValidationError):
+        page.text = "changed"
+
+
 # --- OCRResult ---
 
 
@@ -116,6 +122,12 @@ def test_ocr_result_rejects_confidence_outside_range(confidence):
         OCRResult(text="Hello", pages=[], confidence=confidence)
 
 
+def test_ocr_result_is_immutable():
+    result = OCRResult(text="Hello", pages=[])
+    with pytest.raises(ValidationError):
+        result.text = "changed"
+
+
 # --- VisionResult ---
 
 
@@ -130,6 +142,12 @@ def test_vision_result_defaults_optionals_to_none():
     assert result.structural_notes is None
 
 
+def test_vision_result_is_immutable():
+    result = VisionResult(content="text")
+    with pytest.raises(ValidationError):
+        result.content = "changed"
+
+
 # --- ReconciledDocument ---
 
 
@@ -149,6 +167,7 @@ def test_reconciled_document_creates_with_markdown_only():
         ("2024-03-15T00:00:00Z", date(2024, 3, 15)),
         ("15/03/2024", date(2024, 3, 15)),
         ("15.03.2024", date(2024, 3, 15)),
+        ("5/3/2024", date(2024, 3, 5)),
         ("  2024-03-15  ", date(2024, 3, 15)),
     ],
 )
@@ -168,6 +187,12 @@ def test_reconciled_document_rejects_unparseable_date():
         ReconciledDocument(markdown="text", document_date="not-a-date")
 
 
+@pytest.mark.parametrize("date_str", ["31/02/2024", "15/03.2024", "15/13/2024"])
+def test_reconciled_document_rejects_invalid_european_date(date_str):
+    with pytest.raises(ValidationError, match="Cannot parse date"):
+        ReconciledDocument(markdown="text", document_date=date_str)
+
+
 def test_reconciled_document_rejects_non_string_date():
     with pytest.raises(ValidationError, match="Cannot parse date from int"):
         ReconciledDocument(markdown="text", document_date=12345)
@@ -1,5 +1,8 @@
 """Tests for the OCR extraction module."""
 
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest import mock
 
 import httpx
@@ -9,8 +12,10 @@ from docproc.config import Config
 from docproc.ocr import (
     OCRError,
     _build_url,
+    _get_client,
     _parse_response,
     _validate_file,
+    aclose_client,
     extract_text,
 )
 
@@ -34,29 +39,56 @@ def _make_config(**overrides: str) -> Config:
     )
 
 
-def _success_response():
-    """Build a mock httpx.Response for a successful OCR call."""
-    resp = mock.Mock(spec=httpx.Response)
-    resp.status_code = 200
-    resp.json.return_value = {
-        "pages": [{"page_number": 1, "text": "Hello world"}],
-        "confidence": 0.99,
-    }
-    return resp
+def _success_response() -> httpx.Response:
+    """Build an httpx.Response for a successful OCR call."""
+    return httpx.Response(
+        200,
+        json={
+            "pages": [{"page_number": 1, "text": "Hello world"}],
+            "confidence": 0.99,
+        },
+    )
 
 
 @pytest.fixture()
 def mock_ocr_client():
-    """Provide a mocked httpx.AsyncClient for OCR tests."""
-    with mock.patch("docproc.ocr.httpx.AsyncClient") as mock_client_cls:
-        mock_client = mock.AsyncMock()
-        mock_client_cls.return_value.__aenter__ = mock.AsyncMock(
-            return_value=mock_client
-        )
-        mock_client_cls.return_value.__aexit__ = mock.AsyncMock(return_value=False)
+    """Provide a mocked shared httpx.AsyncClient for OCR tests."""
+    mock_client = mock.AsyncMock()
+    with mock.patch("docproc.ocr._get_client", return_value=mock_client):
         yield mock_client
 
 
+class _OCRHandler(BaseHTTPRequestHandler):
+    """Answer every POST with a fixed OCR payload over a keep-alive connection."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["Content-Length"]))
+        body = b'{"pages": [{"page_number": 1, "text": "Hello world"}]}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture()
+def ocr_server():
+    """Run a local OCR endpoint and yield its base URL."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OCRHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
 # --- _validate_file ---
 
 
@@ -74,12 +106,26 @@ def test_validate_file_rejects_unsupported_extension(tmp_path):
         _validate_file(f)
 
 
+@mock.patch("docproc.ocr.os.stat")
+def test_validate_file_rejects_extension_without_stat(mock_stat, tmp_path):
+    with pytest.raises(OCRError, match="Unsupported file type"):
+        _validate_file(tmp_path / "notes.txt")
+    assert mock_stat.call_count == 0
+
+
 def test_validate_file_rejects_missing_file(tmp_path):
     f = tmp_path / "missing.pdf"
     with pytest.raises(OCRError, match="File not found"):
         _validate_file(f)
 
 
+def test_validate_file_rejects_directory(tmp_path):
+    d = tmp_path / "folder.pdf"
+    d.mkdir()
+    with pytest.raises(OCRError, match="not a regular file"):
+        _validate_file(d)
+
+
 @pytest.mark.parametrize("ext", [".PDF", ".Png", ".JPG"])
 def test_validate_file_is_case_insensitive(tmp_path, ext):
     f = tmp_path / f"doc{ext}"
@@ -105,6 +151,57 @@ def test_build_url_adds_leading_slash():
     assert _build_url(config) == "http://localhost:8000/v1/ocr"
 
 
+# --- _get_client / aclose_client ---
+
+
+async def test_get_client_reuses_shared_client():
+    try:
+        assert _get_client() is _get_client()
+    finally:
+        await aclose_client()
+
+
+async def test_aclose_client_closes_and_allows_recreation():
+    client = _get_client()
+    await aclose_client()
+    assert client.is_closed
+    new_client = _get_client()
+    try:
+        assert new_client is not client
+    finally:
+        await aclose_client()
+
+
+async def test_aclose_client_is_noop_without_client():
+    await aclose_client()
+    await aclose_client()
+
+
+async def test_get_client_rebuilds_client_for_new_event_loop():
+    client = _get_client()
+    with mock.patch("docproc.ocr._client_loop", object()):
+        new_client = _get_client()
+    try:
+        assert new_client is not client
+    finally:
+        await client.aclose()
+        await aclose_client()
+
+
+def test_extract_text_works_across_separate_event_loops(tmp_path, ocr_server):
+    pdf = tmp_path / "doc.pdf"
+    pdf.write_bytes(b"%PDF-fake")
+    config = _make_config(base_url=ocr_server)
+
+    try:
+        first = asyncio.run(extract_text(pdf, config))
+        second = asyncio.run(extract_text(pdf, config))
+    finally:
+        asyncio.run(aclose_client())
+
+    assert first.text == second.text == "Hello world"
+
+
 # --- _parse_response ---
 
 
@@ -158,6 +255,17 @@ def test_parse_response_raises_on_invalid_page_number():
         _parse_response(data)
 
 
+def test_parse_response_validates_every_page():
+    data = {
+        "pages": [
+            {"page_number": 1, "text": "Page one"},
+            {"page_number": -1, "text": "Bad page"},
+        ]
+    }
+    with pytest.raises(OCRError, match="Malformed OCR response"):
+        _parse_response(data)
+
+
 # --- extract_text (integration, mocked HTTP) ---
 
 
@@ -192,9 +300,7 @@ async def test_extract_text_retries_on_5xx_then_succeeds(tmp_path, mock_ocr_clie
     pdf = tmp_path / "doc.pdf"
     pdf.write_bytes(b"%PDF-fake")
 
-    error_resp = mock.Mock(spec=httpx.Response)
-    error_resp.status_code = 503
-    error_resp.text = "Service Unavailable"
+    error_resp = httpx.Response(503, text="Service Unavailable")
     mock_ocr_client.post.side_effect = [error_resp, _success_response()]
 
     with mock.patch("docproc.ocr.asyncio.sleep", new_callable=mock.AsyncMock):
@@ -240,9 +346,7 @@ async def test_extract_text_raises_after_max_retries(tmp_path, mock_ocr_client):
     pdf = tmp_path / "doc.pdf"
     pdf.write_bytes(b"%PDF-fake")
 
-    error_resp = mock.Mock(spec=httpx.Response)
-    error_resp.status_code = 500
-    error_resp.text = "Internal Server Error"
+    error_resp = httpx.Response(500, text="Internal Server Error")
     mock_ocr_client.post.return_value = error_resp
 
     with (
@@ -258,9 +362,7 @@ async def test_extract_text_fails_immediately_on_4xx(tmp_path, mock_ocr_client):
     pdf = tmp_path / "doc.pdf"
     pdf.write_bytes(b"%PDF-fake")
 
-    error_resp = mock.Mock(spec=httpx.Response)
-    error_resp.status_code = 422
-    error_resp.text = "Unprocessable Entity"
+    error_resp = httpx.Response(422, text="Unprocessable Entity")
     mock_ocr_client.post.return_value = error_resp
 
     with pytest.raises(OCRError, match="Client error 422"):
@@ -282,6 +384,52 @@ async def test_extract_text_sends_correct_auth_and_file(tmp_path, mock_ocr_clien
     assert filename == "doc.pdf"
 
 
+async def test_extract_text_streams_file_and_closes_it(tmp_path, mock_ocr_client):
+    pdf = tmp_path / "doc.pdf"
+    pdf.write_bytes(b"%PDF-fake")
+    mock_ocr_client.post.return_value = _success_response()
+
+    await extract_text(pdf, _make_config())
+
+    stream = mock_ocr_client.post.call_args.kwargs["files"]["file"][1]
+    assert stream.name == str(pdf)
+    assert stream.closed
+
+
+async def test_extract_text_raises_on_unreadable_file(tmp_path, mock_ocr_client):
+    pdf = tmp_path / "doc.pdf"
+    pdf.write_bytes(b"%PDF-fake")
+
+    with (
+        mock.patch("docproc.ocr.Path.open", side_effect=PermissionError("denied")),
+        pytest.raises(OCRError, match="Failed to read file"),
+    ):
+        await extract_text(pdf, _make_config())
+
+    assert mock_ocr_client.post.call_count == 0
+
+
+@pytest.mark.parametrize(
+    "filename,expected",
+    [
+        ("doc.pdf", "application/pdf"),
+        ("scan.PNG", "image/png"),
+        ("photo.jpeg", "image/jpeg"),
+        ("fax.tif", "image/tiff"),
+    ],
+)
+async def test_extract_text_sends_mime_type_for_extension(
+    tmp_path, filename, expected, mock_ocr_client
+):
+    f = tmp_path / filename
+    f.write_bytes(b"fake-content")
+    mock_ocr_client.post.return_value = _success_response()
+
+    await extract_text(f, _make_config())
+
+    assert mock_ocr_client.post.call_args.kwargs["files"]["file"][2] == expected
+
+
 @pytest.mark.parametrize("ext", [".pdf", ".png", ".jpg", ".jpeg", ".tiff", ".tif"])
 async def test_extract_text_accepts_all_image_types(tmp_path, ext, mock_ocr_client):
     f = tmp_path / f"doc{ext}"
@@ -297,9 +445,7 @@ async def test_extract_text_exponential_backoff_delays(tmp_path, mock_ocr_client
     pdf = tmp_path / "doc.pdf"
     pdf.write_bytes(b"%PDF-fake")
 
-    error_resp = mock.Mock(spec=httpx.Response)
-    error_resp.status_code = 500
-    error_resp.text = "Internal Server Error"
+    error_resp = httpx.Response(500, text="Internal Server Error")
     mock_ocr_client.post.return_value = error_resp
 
     mock_sleep = mock.AsyncMock()
@@ -318,10 +464,7 @@ async def test_extract_text_raises_on_non_json_response(tmp_path, mock_ocr_clien
     pdf = tmp_path / "doc.pdf"
     pdf.write_bytes(b"%PDF-fake")
 
-    bad_resp = mock.Mock(spec=httpx.Response)
-    bad_resp.status_code = 200
-    bad_resp.json.side_effect = ValueError("No JSON")
-    bad_resp.text = "<html>Error page</html>"
+    bad_resp = httpx.Response(200, text="<html>Error page</html>")
     mock_ocr_client.post.return_value = bad_resp
 
     with pytest.raises(OCRError, match="non-JSON response"):
@@ -332,9 +475,7 @@ async def test_extract_text_raises_on_malformed_api_response(tmp_path, mock_ocr_
     pdf = tmp_path / "doc.pdf"
     pdf.write_bytes(b"%PDF-fake")
 
-    bad_resp = mock.Mock(spec=httpx.Response)
-    bad_resp.status_code = 200
-    bad_resp.json.return_value = {"error": "quota exceeded"}
+    bad_resp = httpx.Response(200, json={"error": "quota exceeded"})
     mock_ocr_client.post.return_value = bad_resp
 
     with pytest.raises(OCRError, match="missing 'pages' key"):